@@ -117,12 +117,18 @@ class App:
         This method starts the application lifecycle and begins processing requests.
         It should be called after all configuration and setup is complete.
         """
-        # Publish application.starting event
         import asyncio
+        from forge_core.kernel import install_uvloop
+        
+        # The event loop policy has to be chosen before the first loop exists
+        if self._config.http.get("uvloop", True):
+            install_uvloop()
+        
+        # Publish application.starting event
         asyncio.run(self._event_service.publish("application.starting", self))
         
         self._lifecycle.start()
-        self._kernel.run()
+        asyncio.run(self._kernel.run())
 
     def stop(self) -> None:
         """Stop the Forge application.
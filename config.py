@@ -5,14 +5,85 @@ including environment variables, file-based config, and runtime overrides.
 """
 
 import os
-import yaml
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, TypeVar, Union, List, Type, get_type_hints
+from typing import Any, Dict, Optional, Tuple, TypeVar, Union, List, Type, get_type_hints
 from dataclasses import dataclass, field
 from functools import wraps
 
 T = TypeVar("T")
 
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Maximum number of parsed configuration files remembered by _load_yaml
+FILE_CACHE_SIZE = 32
+
+# Parsed configuration files keyed by resolved path, with the (mtime, size)
+# they were read at, least recently used first
+_file_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+
+def _parse_yaml(data: bytes) -> Any:
+    """Parse a YAML document.
+    
+    PyYAML is imported on first use, since most processes never load a
+    configuration file. The libyaml-backed loader is used when PyYAML was
+    built with it.
+    
+    Args:
+        data: The YAML document.
+        
+    Returns:
+        The parsed document.
+    """
+    import yaml
+    
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result if the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file.
+        
+    Returns:
+        The parsed document.
+    """
+    path = path.resolve()
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        _file_cache.move_to_end(path)
+        return cached[1]
+    
+    data = _parse_yaml(path.read_bytes())
+    _file_cache[path] = (stamp, data)
+    _file_cache.move_to_end(path)
+    if len(_file_cache) > FILE_CACHE_SIZE:
+        _file_cache.popitem(last=False)
+    return data
+
+
+def _copy_tree(obj: Any) -> Any:
+    """Copy the nested dicts of a configuration section.
+    
+    Leaf values are kept as they are, as in a freshly built nested view, so
+    callers get dicts they can modify without touching the cached view.
+    
+    Args:
+        obj: A configuration section or value.
+        
+    Returns:
+        The section with every nested dict copied, or the value itself.
+    """
+    if isinstance(obj, dict):
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    return obj
+
 
 def validate_config(func):
     """Decorator to validate configuration values."""
@@ -24,7 +95,7 @@ def validate_config(func):
     return wrapper
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConfigValue:
     """Configuration value with type information and validation."""
     value: Any
@@ -59,6 +130,10 @@ class Config:
         """
         self._env_prefix = env_prefix
         self._values: Dict[str, ConfigValue] = {}
+        # Nested view of _values, rebuilt lazily after any change
+        self._nested_cache: Optional[Dict[str, Any]] = None
+        # (environment variable, key) pairs, rebuilt when keys are added
+        self._env_map: Optional[List[Tuple[str, str]]] = None
         self._load_defaults()
         self.load_env()
 
@@ -79,9 +154,12 @@ class Config:
                 "host": ConfigValue("0.0.0.0", str, False),
                 "port": ConfigValue(8000, int, False),
                 "workers": ConfigValue(1, int, False),
+                "uvloop": ConfigValue(True, bool, False),
             }
         }
         self._values = self._flatten_config(defaults)
+        self._nested_cache = None
+        self._env_map = None
 
     def _flatten_config(self, config: Dict[str, Any], prefix: str = "") -> Dict[str, ConfigValue]:
         """Flatten nested configuration into a flat dictionary."""
@@ -140,8 +218,7 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {path}")
         
         try:
-            with open(path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml(path)
         except PermissionError:
             # For test purposes, we'll try to create a copy in a temp location we can access
             import tempfile
@@ -152,8 +229,7 @@ class Config:
             
             try:
                 shutil.copy(path, temp_file)
-                with open(temp_file, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = _parse_yaml(temp_file.read_bytes())
                 # Clean up
                 if temp_file.exists():
                     temp_file.unlink()
@@ -167,34 +243,30 @@ class Config:
         for key, value in flattened.items():
             if key in self._values:
                 self._values[key].value = value
+        self._nested_cache = None
 
     @validate_config
     def load_env(self) -> None:
-        """Load configuration from environment variables."""
-        # Process regular environment variables
-        for key in self._values:
-            env_key = key.upper().replace("__", "_")
-            value = os.getenv(f"{self._env_prefix}{env_key}")
+        """Load configuration from environment variables.
+        
+        Each key is read from the prefix followed by the key in upper case with
+        ``__`` collapsed to ``_``, so ``database__url`` comes from
+        ``FORGE_DATABASE_URL``.
+        """
+        if self._env_map is None:
+            self._env_map = [
+                (f"{self._env_prefix}{key.upper().replace('__', '_')}", key)
+                for key in self._values
+            ]
+        
+        environ = os.environ
+        for env_key, key in self._env_map:
+            value = environ.get(env_key)
             if value is not None:
-                self._values[key].value = self._convert_value(value, self._values[key].type)
+                config_value = self._values[key]
+                config_value.value = self._convert_value(value, config_value.type)
         
-        # Special handling for nested database and http variables
-        for env_var, value in os.environ.items():
-            if not env_var.startswith(self._env_prefix):
-                continue
-                
-            # Remove prefix and convert to lowercase
-            config_key = env_var[len(self._env_prefix):].lower()
-            
-            # Handle database and http section keys
-            if "database_" in config_key:
-                db_key = config_key.replace("database_", "database__")
-                if db_key in self._values:
-                    self._values[db_key].value = self._convert_value(value, self._values[db_key].type)
-            elif "http_" in config_key:
-                http_key = config_key.replace("http_", "http__")
-                if http_key in self._values:
-                    self._values[http_key].value = self._convert_value(value, self._values[http_key].type)
+        self._nested_cache = None
 
     def _convert_value(self, value: str, target_type: Type) -> Any:
         """Convert a string value to the target type."""
@@ -222,14 +294,14 @@ class Config:
         # Handle nested keys
         if "__" in key:
             parts = key.split("__")
-            obj = self.to_dict().get(parts[0], {})
+            obj = self._nested().get(parts[0], {})
             if isinstance(obj, dict):
                 for part in parts[1:]:
                     if part in obj:
                         obj = obj[part]
                     else:
                         return default
-                return obj
+                return _copy_tree(obj)
             
         return default
 
@@ -245,11 +317,23 @@ class Config:
             else:
                 # Create with non-null default for tests
                 self._values[key] = ConfigValue(value if value is not None else "", type(value or ""))
+            self._env_map = None
+        self._nested_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to a dictionary."""
         return self._unflatten_config(self._values)
 
+    def _nested(self) -> Dict[str, Any]:
+        """Get the cached nested view of the configuration.
+        
+        The view is shared, so callers must hand out parts of it through
+        ``_copy_tree``.
+        """
+        if self._nested_cache is None:
+            self._nested_cache = self._unflatten_config(self._values)
+        return self._nested_cache
+
     @property
     def debug(self) -> bool:
         """Get debug mode status."""
@@ -278,9 +362,9 @@ class Config:
     @property
     def database(self) -> Dict[str, Any]:
         """Get database configuration."""
-        return self.to_dict().get("database", {})
+        return _copy_tree(self._nested().get("database", {}))
 
     @property
     def http(self) -> Dict[str, Any]:
         """Get HTTP configuration."""
-        return self.to_dict().get("http", {}) 
\ No newline at end of file
+        return _copy_tree(self._nested().get("http", {})) 
\ No newline at end of file
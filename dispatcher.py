@@ -0,0 +1,204 @@
+"""Ahead-of-time route dispatcher generation for the Forge framework.
+
+This module turns the routes registered with a kernel into a generated Python
+module containing a flat ``dispatch(method, path)`` function. Static paths are
+compared directly and parameterised paths use regular expressions compiled at
+module import time, so production deployments can import the generated module
+instead of walking every router on each request.
+"""
+
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, Union
+
+# Version of the generated module layout. Bump when the generated code changes
+# shape so that stale files on disk are regenerated.
+DISPATCHER_FORMAT = 2
+
+
+def _route_fields(route: Any) -> Tuple[str, List[str]]:
+    """Get the path and methods of a route.
+
+    Args:
+        route: A dict-style route as produced by SimpleRouter.
+
+    Returns:
+        A tuple containing the route path and its HTTP methods.
+
+    Raises:
+        ValueError: If the route is not a dict-style route.
+    """
+    if not isinstance(route, dict) or "path" not in route or "methods" not in route:
+        raise ValueError(f"Cannot compile route of type {type(route).__name__}")
+    return route["path"], list(route["methods"])
+
+
+def route_signature(routes: List[Any]) -> str:
+    """Compute a signature identifying a route table.
+
+    The signature changes whenever a route is added, removed, reordered or has
+    its path or methods changed, which is what invalidates a generated module.
+
+    Args:
+        routes: The routes in match order.
+
+    Returns:
+        A hex digest of the route table.
+    """
+    digest = hashlib.sha1(f"format={DISPATCHER_FORMAT}".encode())
+    for route in routes:
+        path, methods = _route_fields(route)
+        digest.update(repr((path, methods)).encode())
+    return digest.hexdigest()
+
+
+def compile_path_pattern(path: str) -> Tuple[str, List[str]]:
+    """Compile a route path with ``{param}`` segments to a regular expression.
+
+    Each parameter matches exactly one path segment. Literal segments are
+    escaped, and the expression is anchored at the end so that ``match``
+    behaves like a full match.
+
+    Args:
+        path: The route path pattern.
+
+    Returns:
+        A tuple containing the regular expression source and the parameter names.
+    """
+    params = []
+    parts = []
+    for part in path.split("/"):
+        if part.startswith("{") and part.endswith("}"):
+            params.append(part[1:-1])
+            parts.append("([^/]*)")
+        else:
+            parts.append(re.escape(part))
+    return "/".join(parts) + r"\Z", params
+
+
+def generate_source(routes: List[Any]) -> str:
+    """Generate the source of a dispatcher module for a route table.
+
+    The generated ``dispatch(method, path)`` function returns the index of the
+    first matching route together with its path parameters, or ``(None, {})``
+    if no route matches. Only routes with as many segments as the path are
+    tried, in the same order the routers would try them.
+
+    Args:
+        routes: The routes in match order.
+
+    Returns:
+        The Python source of the dispatcher module.
+
+    Raises:
+        ValueError: If a route cannot be compiled.
+    """
+    lines = [
+        '"""Generated by forge_core.dispatcher. Do not edit."""',
+        "",
+        "import re",
+        "",
+        f"SIGNATURE = {route_signature(routes)!r}",
+        "",
+    ]
+
+    # Group route indexes by method and then by number of "/" in the path,
+    # preserving match order. Every segment, literal or parameter, spans
+    # exactly one "/", so a route can only match paths with the same count.
+    by_method: Dict[str, Dict[int, List[int]]] = {}
+    patterns: Dict[int, Tuple[str, List[str]]] = {}
+    for index, route in enumerate(routes):
+        path, methods = _route_fields(route)
+        if "{" in path and "}" in path:
+            patterns[index] = compile_path_pattern(path)
+            lines.append(f"_RX{index} = re.compile({patterns[index][0]!r})")
+        depth = path.count("/")
+        for method in methods:
+            by_method.setdefault(method, {}).setdefault(depth, []).append(index)
+
+    lines += ["", "", "def dispatch(method, path):", '    depth = path.count("/")']
+    method_keyword = "if"
+    for method, by_depth in by_method.items():
+        lines.append(f"    {method_keyword} method == {method!r}:")
+        method_keyword = "elif"
+        depth_keyword = "if"
+        for depth, indexes in by_depth.items():
+            lines.append(f"        {depth_keyword} depth == {depth}:")
+            depth_keyword = "elif"
+            for index in indexes:
+                if index in patterns:
+                    names = patterns[index][1]
+                    values = ", ".join(
+                        f"{name!r}: m.group({group})" for group, name in enumerate(names, 1)
+                    )
+                    lines.append(f"            m = _RX{index}.match(path)")
+                    lines.append("            if m:")
+                    lines.append(f"                return {index}, {{{values}}}")
+                else:
+                    lines.append(f"            if path == {routes[index]['path']!r}:")
+                    lines.append(f"                return {index}, {{}}")
+    lines += ["    return None, {}", ""]
+
+    return "\n".join(lines)
+
+
+def load_module(path: Union[str, Path]) -> ModuleType:
+    """Import a generated dispatcher module from a file.
+
+    Args:
+        path: Path to the generated module.
+
+    Returns:
+        The imported module.
+    """
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(f"forge_core._dispatcher_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def compile_dispatcher(routes: List[Any], path: Union[str, Path]) -> ModuleType:
+    """Load a dispatcher module for a route table, generating it if needed.
+
+    An existing file is reused when its signature matches the route table.
+    Otherwise the module is regenerated and written to ``path``. The file is
+    written under a temporary name and moved into place, so processes
+    compiling to the same path never import a partially written module.
+
+    Args:
+        routes: The routes in match order.
+        path: Path of the generated module.
+
+    Returns:
+        The imported dispatcher module.
+
+    Raises:
+        ValueError: If a route cannot be compiled.
+    """
+    path = Path(path)
+    signature = route_signature(routes)
+
+    if path.exists():
+        module = load_module(path)
+        if getattr(module, "SIGNATURE", None) == signature:
+            return module
+
+    source = generate_source(routes)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(source)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return load_module(path)
@@ -8,10 +8,10 @@ It centralizes error handling logic and provides a consistent way to
 handle errors across the application.
 """
 
-import json
 import traceback
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+from forge_core import serialization
 from forge_core.services import BaseService
 from forge_core.interfaces import IRequest, IResponse
 from forge_core.test_utils import MockResponse
@@ -186,7 +186,7 @@ class ErrorService(BaseService):
                 )
         
         return MockResponse(
-            body=json.dumps(error_data).encode(),
+            body=serialization.dumps(error_data),
             status=status_code,
             headers={"Content-Type": "application/json"}
         ) 
\ No newline at end of file
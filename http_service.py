@@ -19,6 +19,7 @@ except ImportError:
     class HandlerNotFound(Exception):
         pass
 
+from forge_core import serialization
 from forge_core.interfaces import IRequest, IResponse
 from forge_core.services import BaseService
 from forge_core.test_utils import MockResponse
@@ -116,14 +117,13 @@ class HttpService(BaseService):
         print(f"Error handling request: {error}")
         
         # Create a default error response
-        import json
         if hasattr(error, "status_code"):
             status_code = error.status_code
         else:
             status_code = 500
             
         return MockResponse(
-            body=json.dumps({"error": str(error)}).encode(),
+            body=serialization.dumps({"error": str(error)}),
             status=status_code,
             headers={"Content-Type": "application/json"}
         ) 
\ No newline at end of file
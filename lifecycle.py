@@ -5,10 +5,13 @@ a Forge application, including startup, shutdown, and request handling events.
 """
 
 import enum
+import logging
 from typing import Any, Callable, Dict, List, Optional, Union, Protocol, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger("forge_core.lifecycle")
+
 
 class LifecyclePhase(enum.Enum):
     """Enumeration of lifecycle phases.
@@ -182,6 +185,20 @@ class LifecycleManager:
         """
         self._hooks[LifecyclePhase.ERROR].append(hook)
     
+    def has_hooks(self, phase: LifecyclePhase) -> bool:
+        """Check if any hooks are registered for a lifecycle phase.
+        
+        Callers on the request path use this to skip awaiting ``trigger``
+        entirely when a phase has nothing to run.
+        
+        Args:
+            phase: The lifecycle phase to check.
+            
+        Returns:
+            True if at least one hook is registered for the phase.
+        """
+        return bool(self._hooks.get(phase))
+    
     async def before_request(self, request: Any) -> Any:
         """Execute hooks before a request is processed.
         
@@ -253,9 +270,9 @@ class LifecycleManager:
                 
                 if response is not None:
                     return response
-            except Exception as hook_error:
+            except Exception:
                 # Log the error but continue to the next hook
-                print(f"Error in error hook: {hook_error}")
+                logger.exception("Error in error hook")
                 continue
         
         return None
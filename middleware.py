@@ -5,10 +5,165 @@ Middleware are components that process requests and responses before and after t
 main route handler execution.
 """
 
-from typing import Any, Callable, List, Protocol, TypeVar, Optional, AsyncIterable, Awaitable
+import asyncio
+import inspect
+import traceback
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Protocol, Tuple, TypeVar, Optional, AsyncIterable, Awaitable
 
 T = TypeVar("T")
 
+ASGIApp = Callable[[Any, Any, Any], Awaitable[None]]
+
+# forge_http.Response, imported on first use to avoid circular imports
+_Response: Any = None
+
+
+def _get_response_cls() -> Any:
+    """Get the forge_http Response class, importing it on first use.
+    
+    Returns:
+        The Response class.
+    """
+    global _Response
+    if _Response is None:
+        from forge_http import Response
+        _Response = Response
+    return _Response
+
+
+class ASGIMiddleware(Protocol):
+    """Protocol for pure ASGI middleware.
+    
+    ASGI middleware wrap the next ASGI application directly instead of
+    receiving request objects, so the whole chain is composed once when the
+    application is built rather than on every request.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the next ASGI application in the chain."""
+        ...
+    
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Handle an ASGI connection."""
+        ...
+
+
+def is_asgi_middleware(middleware: Any) -> bool:
+    """Check if a middleware is an ASGI middleware factory.
+    
+    ASGI middleware are registered as classes (or other factories) taking the
+    next application, whose instances are called with ``(scope, receive, send)``.
+    
+    Args:
+        middleware: The middleware to check.
+        
+    Returns:
+        True if the middleware is an ASGI middleware class.
+    """
+    if not inspect.isclass(middleware):
+        return False
+    
+    call = getattr(middleware, "__call__", None)
+    if call is None or not inspect.iscoroutinefunction(call):
+        return False
+    
+    try:
+        params = list(inspect.signature(call).parameters)
+    except (TypeError, ValueError):
+        return False
+    
+    # Unbound __call__ takes self, scope, receive, send
+    return len(params) == 4
+
+
+def build_asgi_chain(factories: List[Callable[[ASGIApp], ASGIApp]], app: ASGIApp) -> ASGIApp:
+    """Compose ASGI middleware around an application.
+    
+    The first factory becomes the outermost layer.
+    
+    Args:
+        factories: The ASGI middleware factories in registration order.
+        app: The innermost ASGI application.
+        
+    Returns:
+        The composed ASGI application.
+    """
+    for factory in reversed(factories):
+        app = factory(app)
+    return app
+
+
+class _StreamEnd:
+    """Marks the end of a buffered stream, carrying the source's error if any."""
+    
+    __slots__ = ("error",)
+    
+    def __init__(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+
+
+async def buffer_stream(source: AsyncIterable[T], maxsize: int = 2) -> AsyncIterator[T]:
+    """Iterate over an async iterable through a bounded buffer.
+    
+    The source is consumed by a background task that stays up to ``maxsize``
+    chunks ahead of the consumer. Streaming middleware can wrap the body
+    iterator they transform with this so that their stage and the stage
+    producing the body run concurrently instead of in lockstep.
+    
+    Args:
+        source: The async iterable to consume, e.g. a response body stream.
+        maxsize: The number of chunks that may be buffered ahead, at least 1.
+        
+    Yields:
+        The chunks of the source, in order. Exceptions raised by the source,
+        including cancellation, are re-raised to the consumer.
+        
+    Raises:
+        ValueError: If maxsize is less than 1.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    
+    # The queue itself is unbounded so that the end marker can always be put
+    # without waiting; the semaphore bounds the chunks buffered ahead
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(maxsize)
+    
+    async def produce() -> None:
+        end = _StreamEnd()
+        try:
+            async for chunk in source:
+                await slots.acquire()
+                queue.put_nowait(chunk)
+        except Exception as e:
+            end.error = e
+        except BaseException as e:
+            end.error = e
+            raise
+        finally:
+            # Reached even when the source or this task is cancelled, so the
+            # consumer never waits for a chunk that will not come
+            queue.put_nowait(end)
+    
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            chunk = await queue.get()
+            if isinstance(chunk, _StreamEnd):
+                if chunk.error is not None:
+                    raise chunk.error
+                return
+            slots.release()
+            yield chunk
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
 
 class Middleware:
     """Base class for middleware components.
@@ -17,6 +172,10 @@ class Middleware:
     during the request handling lifecycle.
     """
     
+    # Empty slots keep the base from forcing a __dict__ on subclasses that
+    # declare their own __slots__
+    __slots__ = ()
+    
     async def process(self, request: Any, next: Callable[[Any], Awaitable[Any]]) -> Any:
         """Process a request and response.
         
@@ -36,17 +195,49 @@ class MiddlewareStack:
     This class manages a stack of middleware components and applies them in the correct order.
     """
     
-    def __init__(self):
-        """Initialize a new MiddlewareStack."""
+    def __init__(
+        self,
+        excluded_paths: Iterable[str] = (),
+        excluded_prefixes: Iterable[str] = (),
+    ) -> None:
+        """Initialize a new MiddlewareStack.
+        
+        Requests to excluded paths, such as health checks or metrics, skip the
+        middleware and go straight to the handler.
+        
+        Args:
+            excluded_paths: Request paths that bypass the middleware.
+            excluded_prefixes: Request path prefixes that bypass the middleware.
+        """
+        self.excluded_paths = frozenset(excluded_paths)
+        self.excluded_prefixes = tuple(excluded_prefixes)
         self.stack: List[Middleware] = []
+        self.asgi: List[Callable[[ASGIApp], ASGIApp]] = []
+        self._compiled_chain: Optional[Callable[[Any], Awaitable[Any]]] = None
+        self._markers: Optional[Tuple[Tuple[Any, ...], Dict[str, bool]]] = None
+        
+        # Final handler of the request currently flowing through this stack's
+        # compiled chain. Each stack has its own variable so that a stack
+        # processed from inside another stack's middleware ends in its own
+        # handler rather than re-entering the outer chain.
+        self._current_handler: ContextVar[Callable[[Any], Awaitable[Any]]] = ContextVar(
+            "forge_middleware_handler"
+        )
     
     def add(self, middleware: Middleware) -> None:
         """Add a middleware component to the stack.
         
+        ASGI middleware classes are kept separately and applied by ``build``.
+        
         Args:
             middleware: The middleware component to add.
         """
-        self.stack.append(middleware)
+        if is_asgi_middleware(middleware):
+            self.asgi.append(middleware)
+        else:
+            self.stack.append(middleware)
+            self._compiled_chain = None
+            self._markers = None
     
     def remove(self, middleware: Middleware) -> None:
         """Remove a middleware component from the stack.
@@ -56,6 +247,10 @@ class MiddlewareStack:
         """
         if middleware in self.stack:
             self.stack.remove(middleware)
+            self._compiled_chain = None
+            self._markers = None
+        elif middleware in self.asgi:
+            self.asgi.remove(middleware)
     
     def insert(self, index: int, middleware: Middleware) -> None:
         """Insert a middleware component at a specific position in the stack.
@@ -65,6 +260,52 @@ class MiddlewareStack:
             middleware: The middleware component to insert.
         """
         self.stack.insert(index, middleware)
+        self._compiled_chain = None
+        self._markers = None
+    
+    def _collect_markers(self) -> Tuple[Tuple[Any, ...], Dict[str, bool]]:
+        """Find the middleware to flag on each request for test compatibility.
+        
+        Middleware exposing ``name`` and ``called`` are flagged as called and
+        recorded in the request attributes. They are looked up once per stack
+        change rather than probed on every request.
+        
+        Returns:
+            The middleware to flag, and the request attributes to set for them
+            so that they can be applied with a single ``update``.
+        """
+        middlewares = tuple(
+            middleware
+            for middleware in self.stack
+            if hasattr(middleware, 'name') and hasattr(middleware, 'called')
+        )
+        flags = {f"middleware_{middleware.name}": True for middleware in middlewares}
+        self._markers = (middlewares, flags)
+        return self._markers
+    
+    @staticmethod
+    def _mark(request: Any, markers: Tuple[Tuple[Any, ...], Dict[str, bool]]) -> None:
+        """Flag test middleware as called and record them on the request."""
+        middlewares, flags = markers
+        for middleware in middlewares:
+            middleware.called = True
+        attributes = getattr(request, 'attributes', None)
+        if attributes is not None:
+            attributes.update(flags)
+    
+    def build(self, app: ASGIApp) -> ASGIApp:
+        """Wrap an ASGI application with the registered ASGI middleware.
+        
+        This is called once when the server starts, so ASGI middleware add no
+        per-request composition cost.
+        
+        Args:
+            app: The ASGI application to wrap.
+            
+        Returns:
+            The wrapped ASGI application.
+        """
+        return build_asgi_chain(self.asgi, app)
     
     async def process(self, request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Any:
         """Process a request through all middleware in the stack.
@@ -76,16 +317,36 @@ class MiddlewareStack:
         Returns:
             The response after processing.
         """
+        # Without middleware there is no chain to run
+        if not self.stack:
+            return await handler(request)
+        
+        if self.excluded_paths or self.excluded_prefixes:
+            path = request.path
+            if path in self.excluded_paths or (
+                self.excluded_prefixes and path.startswith(self.excluded_prefixes)
+            ):
+                return await handler(request)
+        
         # For test compatibility
-        for middleware in self.stack:
-            if hasattr(middleware, 'name') and hasattr(middleware, 'called'):
-                middleware.called = True
-                if hasattr(request, 'attributes'):
-                    request.attributes[f"middleware_{middleware.name}"] = True
+        markers = self._markers
+        if markers is None:
+            markers = self._collect_markers()
+        if markers[0]:
+            self._mark(request, markers)
+        
+        # The chain is compiled once per stack change; the final handler is
+        # passed through a context variable since it differs per request
+        middleware_chain = self._compiled_chain
+        if middleware_chain is None:
+            middleware_chain = self._compiled_chain = self._create_middleware_chain()
         
-        # Create and execute the middleware chain
-        middleware_chain = self._create_middleware_chain(handler)
-        return await middleware_chain(request)
+        current_handler = self._current_handler
+        token = current_handler.set(handler)
+        try:
+            return await middleware_chain(request)
+        finally:
+            current_handler.reset(token)
     
     def process_request(self, request: Any) -> Any:
         """Process a request through middleware.
@@ -97,11 +358,11 @@ class MiddlewareStack:
             The processed request.
         """
         # For test compatibility
-        for middleware in self.stack:
-            if hasattr(middleware, 'name') and hasattr(middleware, 'called'):
-                middleware.called = True
-                if hasattr(request, 'attributes'):
-                    request.attributes[f"middleware_{middleware.name}"] = True
+        markers = self._markers
+        if markers is None:
+            markers = self._collect_markers()
+        if markers[0]:
+            self._mark(request, markers)
                     
         return request
     
@@ -129,28 +390,61 @@ class MiddlewareStack:
             A response, or the exception if not handled.
         """
         # For simple tests, create a basic error response
-        from forge_http import Response
-        return Response(body=f"Error: {str(exception)}".encode(), status=500)
+        return _get_response_cls()(body=f"Error: {str(exception)}".encode(), status=500)
     
-    def _create_middleware_chain(self, handler: Callable[[Any], Awaitable[Any]]) -> Callable[[Any], Awaitable[Any]]:
+    def _create_middleware_chain(self) -> Callable[[Any], Awaitable[Any]]:
         """Create a chain of middleware components.
         
-        Args:
-            handler: The final handler for the request.
-            
+        The chain ends in the handler passed to the ``process`` call currently
+        running in this context.
+        
         Returns:
             A function that applies all middleware and calls the handler.
         """
-        async def final_handler(request: Any) -> Any:
-            return await handler(request)
-        
-        chain = final_handler
+        chain: Callable[[Any], Awaitable[Any]] = self._call_current_handler
         
         for middleware in reversed(self.stack):
-            next_middleware = chain
-            chain = lambda req, mid=middleware, next=next_middleware: mid.process(req, next)
+            chain = _Dispatcher(middleware.process, chain)
         
         return chain
+    
+    def _call_current_handler(self, request: Any) -> Awaitable[Any]:
+        """Call the final handler of the current ``process`` call on this stack."""
+        return self._current_handler.get()(request)
+
+
+def _call_handler(request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Awaitable[Any]:
+    """Call a handler directly, as an empty middleware pipeline."""
+    return handler(request)
+
+
+class _Dispatcher:
+    """A link in a compiled middleware chain.
+    
+    Each link binds one middleware's ``process`` method to the next link. Links
+    are built once per stack change and shared by all requests; calling a link
+    returns the middleware's coroutine directly without an extra frame.
+    """
+    
+    __slots__ = ("_process", "_next")
+    
+    def __init__(
+        self,
+        process: Callable[[Any, Callable[[Any], Awaitable[Any]]], Awaitable[Any]],
+        next: Callable[[Any], Awaitable[Any]],
+    ) -> None:
+        """Initialize a new chain link.
+        
+        Args:
+            process: The middleware's process method.
+            next: The next link in the chain.
+        """
+        self._process = process
+        self._next = next
+    
+    def __call__(self, request: Any) -> Awaitable[Any]:
+        """Run this link's middleware with the rest of the chain as ``next``."""
+        return self._process(request, self._next)
 
 
 class RequestMiddleware(Protocol):
@@ -217,6 +511,14 @@ class MiddlewareManager:
         self._request_middleware: List[RequestMiddleware] = []
         self._response_middleware: List[ResponseMiddleware] = []
         self._exception_middleware: List[ExceptionMiddleware] = []
+        self._asgi_middleware: List[Callable[[ASGIApp], ASGIApp]] = []
+        
+        # Bound hook methods in dispatch order, rebuilt by add(); response
+        # hooks are stored already reversed
+        self._request_callables: Tuple[Callable[[Any], Any], ...] = ()
+        self._response_callables: Tuple[Callable[[Any, Any], Any], ...] = ()
+        self._exception_callables: Tuple[Callable[[Any, Exception], Any], ...] = ()
+        self._pipeline: Optional[Callable[[Any, Callable[[Any], Awaitable[Any]]], Awaitable[Any]]] = None
         
         # Add the default error handling middleware
         self._default_error_handler = DefaultErrorHandlingMiddleware(app)
@@ -226,19 +528,87 @@ class MiddlewareManager:
         """Add a middleware component.
         
         This method adds a middleware component to the appropriate lists based on
-        its implemented protocols.
+        its implemented protocols. ASGI middleware classes are registered in the
+        ASGI chain applied by ``build``.
         
         Args:
             middleware: The middleware component to add.
         """
+        if is_asgi_middleware(middleware):
+            self._asgi_middleware.append(middleware)
+            return
+        
+        self._pipeline = None
+        
         if hasattr(middleware, "process_request"):
             self._request_middleware.append(middleware)
+            self._request_callables += (middleware.process_request,)
         
         if hasattr(middleware, "process_response"):
             self._response_middleware.append(middleware)
+            self._response_callables = (middleware.process_response,) + self._response_callables
         
         if hasattr(middleware, "process_exception"):
             self._exception_middleware.append(middleware)
+            self._exception_callables += (middleware.process_exception,)
+    
+    def build(self, app: ASGIApp) -> ASGIApp:
+        """Wrap an ASGI application with the registered ASGI middleware.
+        
+        Args:
+            app: The ASGI application to wrap.
+            
+        Returns:
+            The wrapped ASGI application.
+        """
+        return build_asgi_chain(self._asgi_middleware, app)
+    
+    def build_pipeline(self) -> Callable[[Any, Callable[[Any], Awaitable[Any]]], Awaitable[Any]]:
+        """Build a pipeline running request hooks, a handler and response hooks.
+        
+        The pipeline applies all request middleware, awaits the handler and
+        applies all response middleware in a single call, using the hooks
+        registered at build time. Exceptions raised by the handler propagate to
+        the caller.
+        
+        Returns:
+            An async function taking a request and a handler, returning the response.
+        """
+        request_callables = self._request_callables
+        response_callables = self._response_callables
+        
+        # Without request or response hooks the handler is called directly
+        if not request_callables and not response_callables:
+            return _call_handler
+        
+        async def pipeline(request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Any:
+            for process_request in request_callables:
+                request = process_request(request)
+            
+            response = await handler(request)
+            
+            for process_response in response_callables:
+                response = process_response(request, response)
+            return response
+        
+        return pipeline
+    
+    def process(self, request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Awaitable[Any]:
+        """Process a request through the middleware pipeline and a handler.
+        
+        The pipeline is built on first use and rebuilt after middleware are added.
+        
+        Args:
+            request: The request to process.
+            handler: The final handler for the request.
+            
+        Returns:
+            An awaitable resolving to the processed response.
+        """
+        pipeline = self._pipeline
+        if pipeline is None:
+            pipeline = self._pipeline = self.build_pipeline()
+        return pipeline(request, handler)
     
     def process_request(self, request: Any) -> Any:
         """Process a request through all request middleware.
@@ -249,9 +619,12 @@ class MiddlewareManager:
         Returns:
             The processed request.
         """
+        if not self._request_callables:
+            return request
+        
         processed_request = request
-        for middleware in self._request_middleware:
-            processed_request = middleware.process_request(processed_request)
+        for process_request in self._request_callables:
+            processed_request = process_request(processed_request)
         return processed_request
     
     def process_response(self, request: Any, response: Any) -> Any:
@@ -264,9 +637,12 @@ class MiddlewareManager:
         Returns:
             The processed response.
         """
+        if not self._response_callables:
+            return response
+        
         processed_response = response
-        for middleware in reversed(self._response_middleware):
-            processed_response = middleware.process_response(request, processed_response)
+        for process_response in self._response_callables:
+            processed_response = process_response(request, processed_response)
         return processed_response
     
     def process_exception(self, request: Any, exception: Exception) -> Any:
@@ -279,9 +655,9 @@ class MiddlewareManager:
         Returns:
             A response to return to the client.
         """
-        for middleware in self._exception_middleware:
+        for process_exception in self._exception_callables:
             try:
-                response = middleware.process_exception(request, exception)
+                response = process_exception(request, exception)
                 if response is not None:
                     return response
             except Exception:
@@ -292,6 +668,39 @@ class MiddlewareManager:
         raise exception
 
 
+# Status code and message for exceptions handled by DefaultErrorHandlingMiddleware.
+# A message of None uses the exception's own message.
+_EXCEPTION_STATUS = {
+    ValueError: (400, None),
+    PermissionError: (403, "Permission denied"),
+    FileNotFoundError: (404, "Resource not found"),
+}
+
+
+def _lookup_exception_status(exception_type: type) -> Optional[Tuple[int, Optional[str]]]:
+    """Find the status entry for an exception type.
+    
+    The exact type is looked up first; subclasses fall back to the nearest
+    registered base class in their MRO.
+    
+    Args:
+        exception_type: The type of the raised exception.
+        
+    Returns:
+        The (status, message) entry, or None for unmapped exceptions.
+    """
+    entry = _EXCEPTION_STATUS.get(exception_type)
+    if entry is not None:
+        return entry
+    
+    for base in exception_type.__mro__[1:]:
+        entry = _EXCEPTION_STATUS.get(base)
+        if entry is not None:
+            return entry
+    
+    return None
+
+
 class DefaultErrorHandlingMiddleware:
     """Default middleware for handling exceptions.
     
@@ -306,6 +715,7 @@ class DefaultErrorHandlingMiddleware:
             app: The Forge application instance.
         """
         self._app = app
+        self._Response = _get_response_cls()
     
     def process_exception(self, request: Any, exception: Exception) -> Optional[Any]:
         """Process an exception and generate an appropriate error response.
@@ -318,48 +728,35 @@ class DefaultErrorHandlingMiddleware:
             An error response.
         """
         try:
-            # Import locally to avoid circular imports
-            from forge_http import Response
+            Response = self._Response
             
-            # Handle different types of exceptions
-            if isinstance(exception, ValueError):
-                # Bad request for value errors
+            # Client errors for the common exception types
+            entry = _lookup_exception_status(type(exception))
+            if entry is not None:
+                status, message = entry
                 return Response.json(
-                    {"error": str(exception)},
-                    status=400,
+                    {"error": message if message is not None else str(exception)},
+                    status=status,
                 )
-            elif isinstance(exception, PermissionError):
-                # Forbidden for permission errors
+            
+            # Internal server error for all other exceptions
+            debug_mode = getattr(self._app.config, 'debug', False)
+            if debug_mode:
+                # Include traceback in debug mode
                 return Response.json(
-                    {"error": "Permission denied"},
-                    status=403,
+                    {
+                        "error": "Internal server error",
+                        "exception": str(exception),
+                        "traceback": traceback.format_exc(),
+                    },
+                    status=500,
                 )
-            elif isinstance(exception, FileNotFoundError):
-                # Not found for missing files
+            else:
+                # Hide details in production
                 return Response.json(
-                    {"error": "Resource not found"},
-                    status=404,
+                    {"error": "Internal server error"},
+                    status=500,
                 )
-            else:
-                # Internal server error for all other exceptions
-                debug_mode = getattr(self._app.config, 'debug', False)
-                if debug_mode:
-                    # Include traceback in debug mode
-                    import traceback
-                    return Response.json(
-                        {
-                            "error": "Internal server error",
-                            "exception": str(exception),
-                            "traceback": traceback.format_exc(),
-                        },
-                        status=500,
-                    )
-                else:
-                    # Hide details in production
-                    return Response.json(
-                        {"error": "Internal server error"},
-                        status=500,
-                    )
         except Exception:
             # If we can't create a proper response, return None
             # This will cause the exception to be re-raised
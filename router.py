@@ -8,6 +8,7 @@ This module provides router classes for the Forge framework.
 Routers are responsible for matching requests to handlers.
 """
 
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Union
 
 from forge_core.interfaces import IRequest, IResponse
@@ -46,6 +47,42 @@ class IRouter(Protocol):
         ...
 
 
+# Maximum number of parameterised lookups remembered by SimpleRouter.match
+ROUTE_CACHE_SIZE = 1024
+
+
+def _new_node() -> Dict[str, Any]:
+    """Create a route trie node.
+    
+    A node maps literal path segments to child nodes, has at most one child for
+    parameter segments, and holds the route ending at it, if any, as
+    ``(registration index, route, parameter extractor)``.
+    
+    Returns:
+        An empty trie node.
+    """
+    return {"children": {}, "param": None, "leaf": None}
+
+
+def _compile_param_extractor(params: List[Tuple[int, str]]) -> Callable[[List[str]], Dict[str, str]]:
+    """Generate a function extracting path parameters from path segments.
+    
+    For ``/users/{id}/posts/{pid}`` this generates the equivalent of
+    ``lambda segments: {"id": segments[2], "pid": segments[4]}``, so matching
+    builds the params dict directly instead of looping over the positions.
+    
+    Args:
+        params: The (segment position, param name) pairs of a route.
+        
+    Returns:
+        A function mapping the split request path to the route's parameters.
+    """
+    items = ", ".join(f"{name!r}: segments[{position}]" for position, name in params)
+    namespace: Dict[str, Any] = {}
+    exec(f"def extract(segments):\n    return {{{items}}}\n", namespace)
+    return namespace["extract"]
+
+
 class SimpleRouter:
     """A simple router implementation for testing.
     
@@ -59,6 +96,16 @@ class SimpleRouter:
         """Initialize a new SimpleRouter."""
         self._routes = []
         self._middlewares = []
+        self._listeners: List[Callable[[], None]] = []
+        
+        # Static routes keyed by (method, path), and parameterised routes in a
+        # trie of path segments per method (see _new_node for the node layout)
+        self._static: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._tries: Dict[str, Dict[str, Any]] = {}
+        self._route_count = 0
+        
+        # Recently matched parameterised lookups, least recently used first
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], Dict[str, str]]]" = OrderedDict()
     
     @property
     def routes(self) -> List[Any]:
@@ -78,6 +125,14 @@ class SimpleRouter:
         """
         self._middlewares.append(middleware)
     
+    def on_change(self, listener: Callable[[], None]) -> None:
+        """Register a function to call whenever a route is added.
+        
+        Args:
+            listener: A function taking no arguments.
+        """
+        self._listeners.append(listener)
+    
     def add_route(self, path: str, handler: Callable, methods: List[str] = None) -> None:
         """Add a route to the router.
         
@@ -93,6 +148,130 @@ class SimpleRouter:
             "handler": handler
         }
         self._routes.append(route)
+        index = self._route_count
+        self._route_count += 1
+        self._cache.clear()
+        for listener in self._listeners:
+            listener()
+        
+        if "{" in path and "}" in path:
+            self._insert_dynamic(index, route, methods)
+            return
+        
+        for method in methods:
+            # Earlier routes win, so a static path already matched by an earlier
+            # parameterised route keeps being served by that route
+            if (method, path) in self._static:
+                continue
+            if self._match_dynamic(path, method) is not None:
+                continue
+            self._static[(method, path)] = route
+    
+    def _insert_dynamic(self, index: int, route: Dict[str, Any], methods: List[str]) -> None:
+        """Insert a parameterised route into the segment trie.
+        
+        Args:
+            index: The registration index of the route.
+            route: The route to insert.
+            methods: The HTTP methods of the route.
+        """
+        parts = route["path"].split("/")
+        params = [
+            (position, part[1:-1])
+            for position, part in enumerate(parts)
+            if part.startswith("{") and part.endswith("}")
+        ]
+        entry = (index, route, _compile_param_extractor(params))
+        
+        for method in methods:
+            node = self._tries.setdefault(method, _new_node())
+            for part in parts:
+                if part.startswith("{") and part.endswith("}"):
+                    if node["param"] is None:
+                        node["param"] = _new_node()
+                    node = node["param"]
+                else:
+                    node = node["children"].setdefault(part, _new_node())
+            
+            # Routes with the same shape are tried in registration order, so
+            # only the first one can ever match
+            if node["leaf"] is None:
+                node["leaf"] = entry
+    
+    def _match_dynamic(self, path: str, method: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """Match a path against the parameterised routes.
+        
+        Both the literal and the parameter branch are followed at every
+        segment, and the earliest registered matching route wins.
+        
+        Args:
+            path: The request path.
+            method: The request method.
+            
+        Returns:
+            A tuple containing the matched route and its path parameters, or None.
+        """
+        root = self._tries.get(method)
+        if root is None:
+            return None
+        
+        segments = path.split("/")
+        depth = len(segments)
+        best = None
+        
+        stack = [(root, 0)]
+        while stack:
+            node, position = stack.pop()
+            if position == depth:
+                entry = node["leaf"]
+                if entry is not None and (best is None or entry[0] < best[0]):
+                    best = entry
+                continue
+            
+            child = node["children"].get(segments[position])
+            if child is not None:
+                stack.append((child, position + 1))
+            if node["param"] is not None:
+                stack.append((node["param"], position + 1))
+        
+        if best is None:
+            return None
+        
+        _, route, extract = best
+        return route, extract(segments)
+    
+    def find(self, path: str, method: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """Find the route for a request path and method.
+        
+        This is ``match`` without the exception, for callers that treat a miss
+        as an ordinary outcome.
+        
+        Args:
+            path: The request path.
+            method: The request method.
+            
+        Returns:
+            A tuple containing the matched route and any path parameters, or
+            ``(None, {})`` if no route matches.
+        """
+        route = self._static.get((method, path))
+        if route is not None:
+            return route, {}
+        
+        key = (method, path)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached[0], dict(cached[1])
+        
+        match = self._match_dynamic(path, method)
+        if match is not None:
+            self._cache[key] = match
+            if len(self._cache) > ROUTE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return match[0], dict(match[1])
+        
+        return None, {}
     
     def match(self, path: str, method: str) -> Tuple[Any, Dict[str, str]]:
         """Match a request path and method to a route.
@@ -107,39 +286,7 @@ class SimpleRouter:
         Raises:
             ValueError: If no route matches.
         """
-        for route in self._routes:
-            route_path = route["path"]
-            route_methods = route["methods"]
-            
-            # Skip if method doesn't match
-            if method not in route_methods:
-                continue
-            
-            # Simple path parameter handling
-            if "{" in route_path and "}" in route_path:
-                # Extract path params from the pattern
-                path_parts = route_path.split("/")
-                check_parts = path.split("/")
-                
-                # Check if path structures match
-                if len(path_parts) != len(check_parts):
-                    continue
-                
-                params = {}
-                match = True
-                
-                for i, part in enumerate(path_parts):
-                    if part.startswith("{") and part.endswith("}"):
-                        # Extract parameter name
-                        param_name = part[1:-1]
-                        params[param_name] = check_parts[i]
-                    elif part != check_parts[i]:
-                        match = False
-                        break
-                
-                if match:
-                    return route, params
-            elif path == route_path:
-                return route, {}
-        
-        raise ValueError(f"No route found for {method} {path}") 
\ No newline at end of file
+        route, params = self.find(path, method)
+        if route is None:
+            raise ValueError(f"No route found for {method} {path}")
+        return route, params
@@ -7,58 +7,110 @@ This module provides bridge classes that make it easier to migrate from
 the deprecated SimpleRouter in forge_core to the more robust Router in forge_router.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
-
-try:
-    from forge_router import Router as ForgeRouter, RouteService, RouteNotFoundException
-    from forge_router.interfaces import IRoute, IRouteHandler
-    FORGE_ROUTER_AVAILABLE = True
-except ImportError:
-    ForgeRouter = None
-    RouteNotFoundException = Exception
-    IRoute = Any
-    IRouteHandler = Any
-    FORGE_ROUTER_AVAILABLE = False
-    # Define a mock RouteService if forge_router is not available
-    class RouteService:
-        """Mock RouteService for backward compatibility."""
-        
-        def __init__(self):
-            """Initialize a new RouteService."""
-            self._routers = []
-        
-        def register_router(self, router):
-            """Register a router with the service."""
-            self._routers.append(router)
-        
-        def match_route(self, path, method):
-            """Match a request path and method to a route."""
-            for router in self._routers:
-                try:
-                    return router.match(path, method)
-                except Exception:
-                    continue
-            return None, {}
-        
-        def create_handler_with_params(self, request):
-            """Create a handler function with path parameters."""
-            route, params = self.match_route(request.path, request.method)
-            if route is None:
-                raise ValueError(f"No route found for {request.method} {request.path}")
-            
-            if isinstance(route, dict):
-                handler = route["handler"]
-            else:
-                handler = route.handler
-            
-            async def handler_with_params(req):
-                return await handler(req, **params)
-            
-            return handler_with_params
+import functools
+import importlib.util
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 from forge_core.router import SimpleRouter
 from forge_core.interfaces import IRequest, IResponse
 
+# Names resolved from forge_router on first use, or their fallbacks when it is
+# not installed. None until _load_forge_router() has run.
+_forge_router_names: Optional[Dict[str, Any]] = None
+
+# Shared read-only default for routers without middleware support
+_NO_MIDDLEWARE: Tuple[Any, ...] = ()
+
+
+class _FallbackRouteService:
+    """Mock RouteService for backward compatibility."""
+    
+    def __init__(self):
+        """Initialize a new RouteService."""
+        self._routers = []
+    
+    def register_router(self, router):
+        """Register a router with the service."""
+        self._routers.append(router)
+    
+    def match_route(self, path, method):
+        """Match a request path and method to a route."""
+        for router in self._routers:
+            try:
+                return router.match(path, method)
+            except Exception:
+                continue
+        return None, {}
+    
+    def create_handler_with_params(self, request):
+        """Create a handler function with path parameters."""
+        route, params = self.match_route(request.path, request.method)
+        if route is None:
+            raise ValueError(f"No route found for {request.method} {request.path}")
+        
+        if isinstance(route, dict):
+            handler = route["handler"]
+        else:
+            handler = route.handler
+        
+        # Static routes need no wrapper; otherwise bind the params without
+        # allocating a closure per request
+        if not params:
+            return handler
+        return functools.partial(handler, **params)
+
+
+def _load_forge_router() -> Dict[str, Any]:
+    """Import forge_router on first use.
+
+    The import pulls in the whole forge_router dependency graph, so it is
+    deferred until routing is actually needed. ``find_spec`` is checked first
+    so that a missing package does not go through the ImportError path.
+
+    Returns:
+        A dict mapping the names this module exposes to the forge_router
+        objects, or to their fallbacks when forge_router is not available.
+    """
+    global _forge_router_names
+    if _forge_router_names is not None:
+        return _forge_router_names
+
+    names: Dict[str, Any] = {
+        "ForgeRouter": None,
+        "RouteService": _FallbackRouteService,
+        "RouteNotFoundException": Exception,
+        "IRoute": Any,
+        "IRouteHandler": Any,
+        "FORGE_ROUTER_AVAILABLE": False,
+    }
+    if importlib.util.find_spec("forge_router") is not None:
+        try:
+            from forge_router import Router as ForgeRouter, RouteService, RouteNotFoundException
+            from forge_router.interfaces import IRoute, IRouteHandler
+        except ImportError:
+            pass
+        else:
+            names.update(
+                ForgeRouter=ForgeRouter,
+                RouteService=RouteService,
+                RouteNotFoundException=RouteNotFoundException,
+                IRoute=IRoute,
+                IRouteHandler=IRouteHandler,
+                FORGE_ROUTER_AVAILABLE=True,
+            )
+
+    _forge_router_names = names
+    return names
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the forge_router re-exports of this module lazily."""
+    if name in ("ForgeRouter", "RouteService", "RouteNotFoundException",
+                "IRoute", "IRouteHandler", "FORGE_ROUTER_AVAILABLE"):
+        return _load_forge_router()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class RouterBridge:
     """Bridge between SimpleRouter and forge_router.Router.
@@ -70,16 +122,38 @@ class RouterBridge:
     making it easier to migrate code that uses SimpleRouter to use the new Router.
     """
     
+    # Resolved by _get_router_cls() on first construction
+    _router_cls: Optional[type] = None
+    _not_found_exc: type = Exception
+    
     def __init__(self) -> None:
         """Initialize a new RouterBridge.
         
         If forge_router is available, this will use the new Router implementation.
         Otherwise, it will fall back to SimpleRouter.
         """
-        if FORGE_ROUTER_AVAILABLE:
-            self._router = ForgeRouter()
-        else:
-            self._router = SimpleRouter()
+        self._router = type(self)._get_router_cls()()
+        self._is_simple = isinstance(self._router, SimpleRouter)
+        
+        # Resolve how to register middleware once rather than on every call
+        add_middleware = getattr(self._router, 'add_middleware', None)
+        if add_middleware is None:
+            middlewares = getattr(self._router, '_middlewares', None)
+            add_middleware = middlewares.append if middlewares is not None else None
+        self._add_middleware = add_middleware
+    
+    @classmethod
+    def _get_router_cls(cls) -> type:
+        """Get the router class to wrap, importing forge_router on first call.
+        
+        Returns:
+            forge_router.Router if it is available, otherwise SimpleRouter.
+        """
+        if cls._router_cls is None:
+            names = _load_forge_router()
+            cls._not_found_exc = names["RouteNotFoundException"]
+            cls._router_cls = names["ForgeRouter"] or SimpleRouter
+        return cls._router_cls
     
     @property
     def routes(self) -> List[Any]:
@@ -87,9 +161,9 @@ class RouterBridge:
         return self._router.routes
     
     @property
-    def middleware(self) -> List[Any]:
+    def middleware(self) -> Sequence[Any]:
         """Get middleware applied to all routes in this router."""
-        return getattr(self._router, 'middleware', [])
+        return getattr(self._router, 'middleware', _NO_MIDDLEWARE)
     
     def add_middleware(self, middleware: Any) -> None:
         """Add middleware to the router.
@@ -97,10 +171,8 @@ class RouterBridge:
         Args:
             middleware: The middleware to add.
         """
-        if hasattr(self._router, 'add_middleware'):
-            self._router.add_middleware(middleware)
-        elif hasattr(self._router, '_middlewares'):
-            self._router._middlewares.append(middleware)
+        if self._add_middleware is not None:
+            self._add_middleware(middleware)
     
     def add_route(self, path: str, handler: Callable, methods: List[str] = None) -> None:
         """Add a route to the router.
@@ -112,7 +184,9 @@ class RouterBridge:
         """
         methods = methods or ["GET"]
         
-        if isinstance(self._router, SimpleRouter):
+        if self._is_simple or inspect.iscoroutinefunction(handler):
+            # Coroutine functions already satisfy IRouteHandler, so they are
+            # registered as-is instead of behind a pass-through wrapper
             self._router.add_route(path, handler, methods)
         else:
             # Adapt the handler to match the IRouteHandler interface expected by forge_router
@@ -136,7 +210,7 @@ class RouterBridge:
         """
         try:
             return self._router.match(path, method)
-        except RouteNotFoundException as e:
+        except self._not_found_exc as e:
             # Convert RouteNotFoundException to ValueError for backward compatibility
             raise ValueError(str(e))
 
@@ -153,7 +227,4 @@ def create_router() -> Union[SimpleRouter, Any]:
     Returns:
         A router instance.
     """
-    if FORGE_ROUTER_AVAILABLE:
-        return ForgeRouter()
-    else:
-        return SimpleRouter() 
\ No newline at end of file
+    return RouterBridge._get_router_cls()() 
\ No newline at end of file
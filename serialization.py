@@ -0,0 +1,33 @@
+"""JSON serialization helpers for the Forge framework.
+
+This module provides the JSON encoding used when building HTTP bodies. It uses
+orjson when it is installed, which produces bytes directly, and falls back to
+the standard library json module otherwise.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import json
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        The JSON document as bytes.
+
+    Raises:
+        TypeError: If the data is not JSON serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
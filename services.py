@@ -4,7 +4,8 @@ This module provides service classes that implement business logic and
 act as a layer between the HTTP handlers and the data models.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Protocol, TypeVar, Union, cast
+from functools import cached_property
+from typing import Any, Dict, Optional, Protocol, TypeVar
 
 from kink import Container
 
@@ -32,14 +33,14 @@ class BaseService:
         
         Args:
             container: Optional dependency injection container. If not provided,
-                       a new container will be created.
+                       a new container will be created on first use.
         """
-        self._container = container or Container()
+        self._container_override = container
     
-    @property
+    @cached_property
     def container(self) -> Container:
         """Get the dependency injection container used by this service."""
-        return self._container
+        return self._container_override or Container()
         
 
 class ServiceRegistry:
@@ -53,9 +54,9 @@ class ServiceRegistry:
         
         Args:
             container: Optional dependency injection container. If not provided,
-                       a new container will be created.
+                       a new container will be created on first use.
         """
-        self._container = container or Container()
+        self._container_override = container
         self._services: Dict[str, Any] = {}
     
     def register(self, name: str, service: Any) -> None:
@@ -67,9 +68,8 @@ class ServiceRegistry:
         """
         self._services[name] = service
         
-        # Register the service with the container
-        if hasattr(service, "__class__"):
-            self._container[service.__class__] = service
+        # Register the service with the container for resolution by type
+        self.container[type(service)] = service
     
     def get(self, name: str) -> Any:
         """Get a service by name.
@@ -96,7 +96,7 @@ class ServiceRegistry:
         """
         return name in self._services
     
-    @property
+    @cached_property
     def container(self) -> Container:
         """Get the dependency injection container used by this registry."""
-        return self._container 
\ No newline at end of file
+        return self._container_override or Container() 
\ No newline at end of file
@@ -4,8 +4,9 @@ This module provides test utilities that make it easier to test
 Forge Core components without dependencies on other packages.
 """
 
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, Optional, TypeVar, Union
 from forge_core.interfaces import IRequest, IResponse
+from forge_core.serialization import dumps
 from forge_http.headers import Headers
 
 T = TypeVar('T')
@@ -14,6 +15,12 @@ T = TypeVar('T')
 class MockRequest:
     """Mock implementation of IRequest for testing."""
     
+    # route_params is assigned by the kernel whenever a route matches
+    __slots__ = (
+        "_method", "_url", "_path", "_headers", "_body", "_query_params",
+        "attributes", "route_params",
+    )
+    
     def __init__(
         self,
         method: str = "GET",
@@ -65,16 +72,18 @@ class MockRequest:
 class MockResponse:
     """Mock implementation of IResponse for testing."""
     
+    __slots__ = ("_body", "_status", "_headers")
+    
     def __init__(
         self,
         body: bytes = b"",
         status: int = 200,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Union[Dict[str, str], Headers]] = None,
     ):
         """Initialize a mock response."""
         self._body = body
         self._status = status
-        self._headers = Headers(headers or {})
+        self._headers = headers if isinstance(headers, Headers) else Headers(headers or {})
     
     @property
     def status(self) -> int:
@@ -101,21 +110,20 @@ class MockResponse:
         return cls(
             body=text.encode("utf-8"),
             status=status,
-            headers=dict(all_headers.items()),  # Convert to dict for constructor
+            headers=all_headers,
         )
     
     @classmethod
     def json(cls, data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> "MockResponse":
         """Create a JSON response."""
-        import json
         # Create a Headers object with the initial headers
         all_headers = Headers(headers or {})
         all_headers.set("Content-Type", "application/json; charset=utf-8")
         
         return cls(
-            body=json.dumps(data).encode("utf-8"),
+            body=dumps(data),
             status=status,
-            headers=dict(all_headers.items()),  # Convert to dict for constructor
+            headers=all_headers,
         )
     
     @classmethod
@@ -128,5 +136,5 @@ class MockResponse:
         return cls(
             body=b"",
             status=status,
-            headers=dict(all_headers.items()),  # Convert to dict for constructor
+            headers=all_headers,
         ) 
\ No newline at end of file
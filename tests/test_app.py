@@ -37,10 +37,12 @@ class MockApp:
     def __init__(self):
         self.middleware_stack = []
         self.routes = {}
+        self._chain = None
         
     def middleware(self, func):
         """Register middleware."""
         self.middleware_stack.append(func)
+        self._chain = None
         return func
         
     def route(self, path):
@@ -49,27 +51,27 @@ class MockApp:
             self.routes[path] = func
             return func
         return decorator
+    
+    async def _final_handler(self, req):
+        handler = self.routes.get(req.url, lambda r: Response.text("Not Found"))
+        req.attributes["execution_order"].append("handler")
+        return handler(req)
         
     def handle_request(self, request):
         """Handle a request with middleware execution."""
         # Define an execution order list that middleware can modify
         request.attributes["execution_order"] = []
         
-        # Create the middleware chain
-        async def final_handler(req):
-            handler = self.routes.get(req.url, lambda r: Response.text("Not Found"))
-            request.attributes["execution_order"].append("handler")
-            return handler(req)
-            
-        # Build middleware chain in reverse
-        handler = final_handler
-        for middleware in reversed(self.middleware_stack):
-            prev_handler = handler
-            handler = lambda req, m=middleware, h=prev_handler: m(req, h)
+        # Build the middleware chain in reverse once and reuse it
+        if self._chain is None:
+            handler = self._final_handler
+            for middleware in reversed(self.middleware_stack):
+                handler = lambda req, m=middleware, h=handler: m(req, h)
+            self._chain = handler
             
         # Execute the chain
         import asyncio
-        return asyncio.run(handler(request))
+        return asyncio.run(self._chain(request))
 
 
 def test_app_middleware_execution_order(request_factory):
@@ -47,52 +47,58 @@ def app():
     # Setup a mock kernel for testing
     mock_kernel = MagicMock()
     
-    # Create a dictionary for route handlers
-    route_handlers = {}
+    # Define the route handlers once
+    async def index_handler(req):
+        return Response.text("Welcome to Forge")
+    
+    async def data_handler(req):
+        return Response.json({
+            "success": True,
+            "data": [1, 2, 3, 4, 5]
+        })
+    
+    async def protected_handler(req):
+        if not req.attributes.get("authenticated", False):
+            return Response.json({
+                "error": "Unauthorized"
+            }, status=401)
+        
+        return Response.json({
+            "success": True,
+            "user_id": req.attributes["user_id"],
+            "message": "This is protected data"
+        })
+    
+    async def user_handler(req):
+        user_id = req.url.rpartition("/")[2]
+        return Response.json({
+            "id": user_id,
+            "name": f"User {user_id}",
+            "email": f"user{user_id}@example.com"
+        })
+    
+    async def error_handler(req):
+        raise ValueError("Test error")
+    
+    async def not_found(req):
+        return Response.text("Not Found", status=404)
+    
+    # Static paths are looked up directly; the only dynamic route is a prefix
+    static_handlers = {
+        "/": index_handler,
+        "/api/data": data_handler,
+        "/api/protected": protected_handler,
+        "/api/error": error_handler,
+    }
     
     # Define a handler lookup function
     def get_handler(request):
-        if request.url == "/":
-            async def index_handler(req):
-                return Response.text("Welcome to Forge")
-            return index_handler
-        elif request.url == "/api/data":
-            async def data_handler(req):
-                return Response.json({
-                    "success": True,
-                    "data": [1, 2, 3, 4, 5]
-                })
-            return data_handler
-        elif request.url == "/api/protected":
-            async def protected_handler(req):
-                if not req.attributes.get("authenticated", False):
-                    return Response.json({
-                        "error": "Unauthorized"
-                    }, status=401)
-                
-                return Response.json({
-                    "success": True,
-                    "user_id": req.attributes["user_id"],
-                    "message": "This is protected data"
-                })
-            return protected_handler
-        elif request.url.startswith("/api/users/"):
-            async def user_handler(req):
-                user_id = request.url.split("/")[-1]
-                return Response.json({
-                    "id": user_id,
-                    "name": f"User {user_id}",
-                    "email": f"user{user_id}@example.com"
-                })
+        handler = static_handlers.get(request.url)
+        if handler is not None:
+            return handler
+        if request.url.startswith("/api/users/"):
             return user_handler
-        elif request.url == "/api/error":
-            async def error_handler(req):
-                raise ValueError("Test error")
-            return error_handler
-        else:
-            async def not_found(req):
-                return Response.text("Not Found", status=404)
-            return not_found
+        return not_found
     
     # Create mock implementations
     mock_kernel._get_handler = get_handler
@@ -109,8 +115,11 @@ def app():
     
     # Add middleware
     logging_middleware = LoggingMiddleware()
+    auth_middleware = AuthMiddleware()
     app.middleware.add(logging_middleware)
-    app.middleware.add(AuthMiddleware())
+    app.middleware.add(auth_middleware)
+    request_order = (logging_middleware, auth_middleware)
+    response_order = (auth_middleware, logging_middleware)
     
     # For simplicity in testing, store the logging middleware directly
     app._test_logging_middleware = logging_middleware
@@ -121,7 +130,7 @@ def app():
         
         # Process through middleware first
         processed_request = request
-        for middleware in [logging_middleware, AuthMiddleware()]:
+        for middleware in request_order:
             try:
                 processed_request = await middleware.process(processed_request, 
                     lambda req: req)  # Just pass through for middleware preprocessing
@@ -139,7 +148,7 @@ def app():
             
         # Process response through middleware
         processed_response = response
-        for middleware in [AuthMiddleware(), logging_middleware]:
+        for middleware in response_order:
             try:
                 processed_response = await middleware.process(processed_request, 
                     lambda req: processed_response)  # Return the response directly
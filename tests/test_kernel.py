@@ -7,7 +7,7 @@ from typing import Optional, Dict
 
 # Use package imports for consistent importing
 from forge_core.kernel import Kernel, HandlerNotFound
-from forge_core.middleware import Middleware, MiddlewareStack
+from forge_core.middleware import Middleware, MiddlewareManager, MiddlewareStack
 from forge_http import Request
 from forge_http import Response
 from forge_core.lifecycle import LifecycleHook, LifecyclePhase, LifecycleManager
@@ -21,10 +21,11 @@ class MockTestMiddleware(Middleware):
     def __init__(self, name):
         self.name = name
         self.called = False
+        self._attribute = f"middleware_{name}"
         
     async def process(self, request, next):
         self.called = True
-        request.attributes[f"middleware_{self.name}"] = True
+        request.attributes[self._attribute] = True
         return await next(request)
 
 # Create a mock App class for testing
@@ -167,6 +168,47 @@ async def test_kernel_error_handling_no_hooks():
     assert b"Test error" in response.body
 
 
+async def test_kernel_middleware_manager_hooks():
+    """Test that the kernel runs MiddlewareManager hooks and routes hook errors to the error path."""
+    app = MockApp()
+    app.middleware = MiddlewareManager(app)
+    kernel = Kernel(app)
+    events = []
+    
+    class Hooks:
+        def process_request(self, request):
+            events.append("request")
+            return request
+        
+        def process_response(self, request, response):
+            events.append("response")
+            return response
+    
+    app.middleware.add(Hooks())
+    
+    async def handler(req):
+        events.append("handler")
+        return Response(body=b"OK", status=200)
+    
+    kernel._get_handler = lambda req: handler
+    
+    response = await kernel.handle(Request(method="GET", url="/test"))
+    
+    assert response.status == 200
+    assert events == ["request", "handler", "response"]
+    
+    class FailingHooks:
+        def process_request(self, request):
+            raise RuntimeError("Hook error")
+    
+    app.middleware.add(FailingHooks())
+    
+    response = await kernel.handle(Request(method="GET", url="/test"))
+    
+    assert response.status == 500
+    assert b"Hook error" in response.body
+
+
 async def test_kernel_error_handling_hook_failure():
     """Test that the kernel continues to the next hook if one fails."""
     app = MockApp()
@@ -449,6 +491,71 @@ async def test_match_route_router_exception():
     router.match.assert_called_once()
 
 
+async def test_compiled_dispatcher(tmp_path):
+    """Test that a compiled dispatcher matches the same routes as the routers."""
+    app = MockApp()
+    kernel = Kernel(app)
+    
+    router = SimpleRouter()
+    async def handler(request, **params):
+        return Response(body=b"Test", status=200)
+    
+    router.add_route("/users", handler, methods=["GET"])
+    router.add_route("/users/{id}", handler, methods=["GET", "POST"])
+    kernel.register_router(router)
+    
+    dispatcher_path = tmp_path / "dispatcher.py"
+    kernel.compile(dispatcher_path)
+    
+    assert dispatcher_path.exists()
+    
+    route, params = kernel._match_route(Request(method="POST", url="/users/123"))
+    assert route["path"] == "/users/{id}"
+    assert params == {"id": "123"}
+    
+    route, params = kernel._match_route(Request(method="GET", url="/users"))
+    assert route["path"] == "/users"
+    assert params == {}
+    
+    route, params = kernel._match_route(Request(method="POST", url="/users"))
+    assert route is None
+    assert params == {}
+
+
+async def test_compiled_dispatcher_route_added_after_compile(tmp_path):
+    """Test that adding a route discards the compiled dispatcher until compile() is called again."""
+    app = MockApp()
+    kernel = Kernel(app)
+    
+    router = SimpleRouter()
+    async def handler(request, **params):
+        return Response(body=b"Test", status=200)
+    
+    router.add_route("/users", handler, methods=["GET"])
+    kernel.register_router(router)
+    dispatcher_path = tmp_path / "dispatcher.py"
+    kernel.compile(dispatcher_path)
+    source = dispatcher_path.read_text()
+    
+    router.add_route("/posts/{id}", handler, methods=["GET"])
+    assert kernel._dispatch is None
+    
+    # Requests fall back to the routers without regenerating the module
+    route, params = kernel._match_route(Request(method="GET", url="/posts/7"))
+    assert route["path"] == "/posts/{id}"
+    assert params == {"id": "7"}
+    assert dispatcher_path.read_text() == source
+    
+    kernel.compile(dispatcher_path)
+    assert kernel._dispatch is not None
+    route, params = kernel._match_route(Request(method="GET", url="/posts/7"))
+    assert route["path"] == "/posts/{id}"
+    assert params == {"id": "7"}
+    
+    # The module is written through a temporary file that is moved into place
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
 async def test_create_not_found_response():
     """Test that _create_not_found_response returns a 404 response."""
     app = MockApp()
@@ -245,4 +245,13 @@ async def test_lifecycle_listener():
     
     assert response is not None
     assert response.status_code == 418
-    assert response.content == b"Listener handled error" 
\ No newline at end of file
+    assert response.content == b"Listener handled error" 
+
+def test_lifecycle_has_hooks(lifecycle_manager):
+    """Test that has_hooks reports whether a phase has registered hooks."""
+    assert lifecycle_manager.has_hooks(LifecyclePhase.BEFORE_REQUEST) is False
+    
+    lifecycle_manager.on_request_begin(lambda req: req)
+    
+    assert lifecycle_manager.has_hooks(LifecyclePhase.BEFORE_REQUEST) is True
+    assert lifecycle_manager.has_hooks(LifecyclePhase.AFTER_REQUEST) is False
@@ -1,9 +1,19 @@
 """Tests for the Middleware system."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 # Use package imports for consistent importing
-from forge_core.middleware import Middleware, MiddlewareStack
+from forge_core.middleware import (
+    DefaultErrorHandlingMiddleware,
+    Middleware,
+    MiddlewareManager,
+    MiddlewareStack,
+    _lookup_exception_status,
+    buffer_stream,
+)
 from forge_http import Request
 from forge_http import Response
 
@@ -119,4 +129,272 @@ async def test_middleware_insertion():
     assert len(stack.stack) == 3
     assert stack.stack[0] == middleware1
     assert stack.stack[1] == middleware2
-    assert stack.stack[2] == middleware3 
\ No newline at end of file
+    assert stack.stack[2] == middleware3 
+
+async def test_asgi_middleware_build():
+    """Test that ASGI middleware are composed around the application once."""
+    events = []
+    
+    class FirstASGIMiddleware:
+        def __init__(self, app):
+            self.app = app
+        
+        async def __call__(self, scope, receive, send):
+            events.append("first")
+            await self.app(scope, receive, send)
+    
+    class SecondASGIMiddleware:
+        def __init__(self, app):
+            self.app = app
+        
+        async def __call__(self, scope, receive, send):
+            events.append("second")
+            await self.app(scope, receive, send)
+    
+    async def app(scope, receive, send):
+        events.append("app")
+    
+    stack = MiddlewareStack()
+    stack.add(FirstASGIMiddleware)
+    stack.add(SecondASGIMiddleware)
+    
+    assert stack.stack == []
+    assert stack.asgi == [FirstASGIMiddleware, SecondASGIMiddleware]
+    
+    asgi_app = stack.build(app)
+    await asgi_app({"type": "http"}, None, None)
+    
+    assert events == ["first", "second", "app"]
+
+
+async def test_middleware_chain_reused_across_handlers():
+    """Test that the compiled chain is reused and calls each request's handler."""
+    stack = MiddlewareStack()
+    stack.add(MockTestMiddleware("first", []))
+    
+    async def handler_a(req):
+        return Response(content="A", status_code=200)
+    
+    async def handler_b(req):
+        return Response(content="B", status_code=200)
+    
+    response_a = await stack.process(Request(method="GET", url="/a"), handler_a)
+    chain = stack._compiled_chain
+    response_b = await stack.process(Request(method="GET", url="/b"), handler_b)
+    
+    assert stack._compiled_chain is chain
+    assert response_a.content == b"A"
+    assert response_b.content == b"B"
+    
+    stack.add(MockTestMiddleware("second", []))
+    
+    assert stack._compiled_chain is None
+
+
+async def test_middleware_excluded_paths():
+    """Test that excluded paths and prefixes bypass the middleware."""
+    events = []
+    stack = MiddlewareStack(excluded_paths=["/health"], excluded_prefixes=["/metrics/"])
+    stack.add(MockTestMiddleware("first", events))
+    
+    async def handler(req):
+        events.append("handler")
+        return Response(content="OK", status_code=200)
+    
+    await stack.process(Request(method="GET", url="/health"), handler)
+    await stack.process(Request(method="GET", url="/metrics/cpu"), handler)
+    assert events == ["handler", "handler"]
+    
+    events.clear()
+    await stack.process(Request(method="GET", url="/test"), handler)
+    assert events == ["first_before", "handler", "first_after"]
+
+
+async def test_buffer_stream():
+    """Test that buffered streams yield all chunks and re-raise source errors."""
+    async def source():
+        for chunk in (b"a", b"b", b"c"):
+            yield chunk
+        raise ValueError("Stream error")
+    
+    chunks = []
+    with pytest.raises(ValueError):
+        async for chunk in buffer_stream(source()):
+            chunks.append(chunk)
+    
+    assert chunks == [b"a", b"b", b"c"]
+
+
+async def test_nested_middleware_stacks():
+    """Test that a stack processed inside another stack's middleware ends in its own handler."""
+    events = []
+    inner = MiddlewareStack()
+    inner.add(MockTestMiddleware("inner", events))
+    
+    class NestingMiddleware(Middleware):
+        async def process(self, request, next):
+            return await inner.process(request, next)
+    
+    outer = MiddlewareStack()
+    outer.add(MockTestMiddleware("outer", events))
+    outer.add(NestingMiddleware())
+    
+    async def handler(req):
+        events.append("handler")
+        return Response(content="OK", status_code=200)
+    
+    response = await outer.process(Request(method="GET", url="/test"), handler)
+    
+    assert response.content == b"OK"
+    assert events == ["outer_before", "inner_before", "handler", "inner_after", "outer_after"]
+
+
+class RecordingHooks:
+    """Request/response hook middleware that records its calls."""
+    
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+    
+    def process_request(self, request):
+        self.events.append(f"{self.name}_request")
+        return request
+    
+    def process_response(self, request, response):
+        self.events.append(f"{self.name}_response")
+        response.headers[f"X-{self.name}"] = "Processed"
+        return response
+
+
+async def test_middleware_manager_hook_order():
+    """Test that request hooks run in order and response hooks in reverse order."""
+    events = []
+    manager = MiddlewareManager(None)
+    manager.add(RecordingHooks("first", events))
+    manager.add(RecordingHooks("second", events))
+    
+    async def handler(req):
+        events.append("handler")
+        return Response(content="OK", status_code=200)
+    
+    await manager.process(Request(method="GET", url="/test"), handler)
+    
+    assert events == [
+        "first_request",
+        "second_request",
+        "handler",
+        "second_response",
+        "first_response",
+    ]
+
+
+async def test_middleware_manager_passes_handler_result_to_response_hooks():
+    """Test that the handler's response is passed through the response hooks."""
+    manager = MiddlewareManager(None)
+    manager.add(RecordingHooks("first", []))
+    
+    handler_response = Response(content="OK", status_code=200)
+    
+    async def handler(req):
+        return handler_response
+    
+    response = await manager.process(Request(method="GET", url="/test"), handler)
+    
+    assert response is handler_response
+    assert response.headers["X-first"] == "Processed"
+
+
+async def test_middleware_manager_hook_exception_propagates():
+    """Test that exceptions raised by hooks propagate out of the pipeline."""
+    events = []
+    
+    class FailingHooks:
+        def process_request(self, request):
+            raise ValueError("Hook error")
+    
+    manager = MiddlewareManager(None)
+    manager.add(RecordingHooks("first", events))
+    manager.add(FailingHooks())
+    
+    async def handler(req):
+        pytest.fail("Handler should not be called")
+    
+    with pytest.raises(ValueError):
+        await manager.process(Request(method="GET", url="/test"), handler)
+    
+    assert events == ["first_request"]
+
+
+async def test_buffer_stream_cancelled_source():
+    """Test that a source raising CancelledError ends the stream instead of hanging the consumer."""
+    async def source():
+        yield b"a"
+        raise asyncio.CancelledError()
+    
+    chunks = []
+    
+    async def consume():
+        async for chunk in buffer_stream(source()):
+            chunks.append(chunk)
+    
+    task = asyncio.ensure_future(consume())
+    done, _ = await asyncio.wait({task}, timeout=1)
+    if not done:
+        task.cancel()
+    
+    assert task in done
+    assert task.cancelled()
+    assert chunks == [b"a"]
+
+
+async def test_buffer_stream_consumer_closes_early():
+    """Test that closing the stream early stops the producer."""
+    produced = []
+    
+    async def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+    
+    stream = buffer_stream(source(), maxsize=2)
+    assert await stream.__anext__() == 0
+    
+    await asyncio.wait_for(stream.aclose(), timeout=1)
+    count = len(produced)
+    for _ in range(5):
+        await asyncio.sleep(0)
+    
+    assert len(produced) == count
+    assert count < 100
+
+
+def test_lookup_exception_status():
+    """Test that exception subclasses get their nearest mapped base's status."""
+    class InvalidInput(ValueError):
+        pass
+    
+    class MissingRecord(InvalidInput, FileNotFoundError):
+        pass
+    
+    assert _lookup_exception_status(ValueError) == (400, None)
+    assert _lookup_exception_status(InvalidInput) == (400, None)
+    assert _lookup_exception_status(MissingRecord) == (400, None)
+    assert _lookup_exception_status(type("Denied", (PermissionError,), {})) == (403, "Permission denied")
+    
+    # Unmapped exceptions, including bases of mapped ones, fall through
+    assert _lookup_exception_status(RuntimeError) is None
+    assert _lookup_exception_status(OSError) is None
+    assert _lookup_exception_status(Exception) is None
+
+
+def test_default_error_handling_subclass_status():
+    """Test that the default error handler maps subclasses and falls back to 500."""
+    class InvalidInput(ValueError):
+        pass
+    
+    app = SimpleNamespace(config=SimpleNamespace(debug=False))
+    middleware = DefaultErrorHandlingMiddleware(app)
+    request = Request(method="GET", url="/test")
+    
+    assert middleware.process_exception(request, InvalidInput("Bad input")).status == 400
+    assert middleware.process_exception(request, RuntimeError("Boom")).status == 500
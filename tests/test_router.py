@@ -0,0 +1,132 @@
+"""Tests for the SimpleRouter class."""
+
+import pytest
+
+# Use package imports for consistent importing
+from forge_core import router as router_module
+from forge_core.router import SimpleRouter
+
+
+async def handler(request, **params):
+    return None
+
+
+def test_find_static_and_dynamic_routes():
+    """Test that find matches static and parameterised routes."""
+    router = SimpleRouter()
+    router.add_route("/users", handler, methods=["GET"])
+    router.add_route("/users/{id}/posts/{pid}", handler, methods=["GET", "POST"])
+    
+    route, params = router.find("/users", "GET")
+    assert route["path"] == "/users"
+    assert params == {}
+    
+    route, params = router.find("/users/1/posts/2", "POST")
+    assert route["path"] == "/users/{id}/posts/{pid}"
+    assert params == {"id": "1", "pid": "2"}
+
+
+def test_find_no_match():
+    """Test that find returns (None, {}) instead of raising on a miss."""
+    router = SimpleRouter()
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    
+    assert router.find("/posts", "GET") == (None, {})
+    assert router.find("/users/1/extra", "GET") == (None, {})
+    assert router.find("/users/1", "DELETE") == (None, {})
+
+
+def test_match_method_mismatch():
+    """Test that match raises ValueError when only the method differs."""
+    router = SimpleRouter()
+    router.add_route("/users", handler, methods=["GET"])
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    
+    with pytest.raises(ValueError):
+        router.match("/users", "POST")
+    with pytest.raises(ValueError):
+        router.match("/users/1", "POST")
+
+
+def test_first_registered_route_wins():
+    """Test that the earliest registered matching route wins across route kinds."""
+    router = SimpleRouter()
+    router.add_route("/users/me", handler, methods=["GET"])
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    router.add_route("/files/{dir}/readme", handler, methods=["GET"])
+    router.add_route("/files/docs/{name}", handler, methods=["GET"])
+    
+    route, params = router.find("/users/me", "GET")
+    assert route["path"] == "/users/me"
+    assert params == {}
+    
+    route, params = router.find("/files/docs/readme", "GET")
+    assert route["path"] == "/files/{dir}/readme"
+    assert params == {"dir": "docs"}
+    
+    route, params = router.find("/files/docs/index", "GET")
+    assert route["path"] == "/files/docs/{name}"
+    assert params == {"name": "index"}
+
+
+def test_static_route_shadowed_by_earlier_param_route():
+    """Test that a static path already matched by an earlier param route is not served by the static route."""
+    router = SimpleRouter()
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    router.add_route("/users/me", handler, methods=["GET", "POST"])
+    
+    route, params = router.find("/users/me", "GET")
+    assert route["path"] == "/users/{id}"
+    assert params == {"id": "me"}
+    
+    # The param route only covers GET, so POST reaches the static route
+    route, params = router.find("/users/me", "POST")
+    assert route["path"] == "/users/me"
+    assert params == {}
+
+
+def test_cache_invalidated_by_add_route():
+    """Test that adding a route clears cached parameterised lookups."""
+    router = SimpleRouter()
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    
+    router.find("/users/1", "GET")
+    assert ("GET", "/users/1") in router._cache
+    
+    assert router.find("/users/1", "POST") == (None, {})
+    router.add_route("/users/{name}", handler, methods=["POST"])
+    
+    assert not router._cache
+    route, params = router.find("/users/1", "POST")
+    assert route["path"] == "/users/{name}"
+    assert params == {"name": "1"}
+
+
+def test_cached_params_are_copies():
+    """Test that mutating returned params does not affect later lookups."""
+    router = SimpleRouter()
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    
+    _, params = router.find("/users/1", "GET")
+    params["id"] = "changed"
+    
+    _, params = router.find("/users/1", "GET")
+    assert params == {"id": "1"}
+
+
+def test_cache_eviction(monkeypatch):
+    """Test that the least recently used lookup is evicted at ROUTE_CACHE_SIZE."""
+    monkeypatch.setattr(router_module, "ROUTE_CACHE_SIZE", 2)
+    router = SimpleRouter()
+    router.add_route("/users/{id}", handler, methods=["GET"])
+    
+    router.find("/users/1", "GET")
+    router.find("/users/2", "GET")
+    router.find("/users/1", "GET")
+    router.find("/users/3", "GET")
+    
+    assert list(router._cache) == [("GET", "/users/1"), ("GET", "/users/3")]
+    
+    route, params = router.find("/users/2", "GET")
+    assert params == {"id": "2"}
+    assert list(router._cache) == [("GET", "/users/3"), ("GET", "/users/2")]
@@ -0,0 +1,43 @@
+"""Tests for the serialization helpers."""
+
+import json
+
+import pytest
+
+# Use package imports for consistent importing
+from forge_core import serialization
+from forge_core.serialization import dumps
+
+
+DATA = {"name": "forge", "tags": ["a", "b"], "count": 3, "text": "café"}
+
+
+def test_dumps_orjson():
+    """Test that dumps returns UTF-8 JSON bytes when orjson is installed."""
+    pytest.importorskip("orjson")
+    
+    body = dumps(DATA)
+    
+    assert isinstance(body, bytes)
+    assert json.loads(body.decode("utf-8")) == DATA
+
+
+def test_dumps_stdlib_fallback(monkeypatch):
+    """Test that dumps falls back to the json module when orjson is unavailable."""
+    monkeypatch.setattr(serialization, "orjson", None)
+    
+    body = dumps(DATA)
+    
+    assert isinstance(body, bytes)
+    assert body == json.dumps(DATA).encode("utf-8")
+    assert json.loads(body.decode("utf-8")) == DATA
+
+
+def test_dumps_unserializable(monkeypatch):
+    """Test that both encoders reject data that is not JSON serializable."""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+    
+    monkeypatch.setattr(serialization, "orjson", None)
+    with pytest.raises(TypeError):
+        dumps({"value": object()})